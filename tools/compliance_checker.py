@@ -58,19 +58,27 @@ License: GPL-3.0-or-later
 
 from __future__ import annotations
 
-import argparse
+import contextlib
+import hashlib
+import io
 import json
+import mmap
 import os
 import re
-import subprocess  # nosec B404 - needed for running fix commands
+import shlex
 import sys
-import urllib.request
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Collection, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
-import yaml  # type: ignore[import-untyped]
+from packaging.version import InvalidVersion, Version
 
 # =============================================================================
 # PROJECT PROFILES
@@ -91,6 +99,10 @@ PROFILE_INDICATORS = {
     PROFILE_ORG_CONFIG: [".github"],  # Special case: repo named .github
 }
 
+# Indicator sets for detect_profile, tested against a directory listing in one probe each
+_PY_IND = frozenset(PROFILE_INDICATORS[PROFILE_PYTHON])
+_SS_IND = frozenset(PROFILE_INDICATORS[PROFILE_STATIC_SITE])
+
 
 # =============================================================================
 # ORGANIZATION STANDARDS CONFIGURATION (Profile-based)
@@ -104,6 +116,11 @@ REQUIRED_FILES_BY_PROFILE = {
     PROFILE_ORG_CONFIG: ["LICENSE", "README.md"],
 }
 
+# Frozen copies of the lists above for set operations (the lists keep report order)
+_REQUIRED_FILE_SETS = {
+    profile: frozenset(files) for profile, files in REQUIRED_FILES_BY_PROFILE.items()
+}
+
 # CI workflow requirements per profile
 CI_REQUIRED_BY_PROFILE = {
     PROFILE_PYTHON: True,
@@ -120,19 +137,35 @@ PRECOMMIT_REQUIRED_BY_PROFILE = {
     PROFILE_ORG_CONFIG: False,
 }
 
-# CLAUDE.md section requirements per profile
+# Profiles that require CI / pre-commit, for a plain membership test in check_repository
+_CI_REQUIRED = frozenset(p for p, required in CI_REQUIRED_BY_PROFILE.items() if required)
+_PRECOMMIT_REQUIRED = frozenset(
+    p for p, required in PRECOMMIT_REQUIRED_BY_PROFILE.items() if required
+)
+
+# CLAUDE.md section requirements per profile (bytes patterns compiled once at import)
 CLAUDE_MD_SECTIONS_BY_PROFILE = {
     PROFILE_PYTHON: [
-        ("Project Overview", r"(?i)#.*project.*overview|#.*overview"),
-        ("Common Commands", r"(?i)#.*common.*commands|#.*commands"),
+        ("Project Overview", re.compile(rb"#.*project.*overview|#.*overview", re.IGNORECASE)),
+        ("Common Commands", re.compile(rb"#.*common.*commands|#.*commands", re.IGNORECASE)),
     ],
     PROFILE_STATIC_SITE: [
-        ("Project Overview", r"(?i)#.*project.*overview|#.*overview"),
+        ("Project Overview", re.compile(rb"#.*project.*overview|#.*overview", re.IGNORECASE)),
     ],
     PROFILE_DOCUMENTATION: [],
     PROFILE_ORG_CONFIG: [],
 }
 
+# Each profile's section patterns as one alternation; group s<i> is section i
+_CLAUDE_MD_SECTIONS_RX = {
+    profile: re.compile(
+        b"|".join(b"(?P<s%d>%s)" % (i, rx.pattern) for i, (_, rx) in enumerate(sections)),
+        re.IGNORECASE,
+    )
+    for profile, sections in CLAUDE_MD_SECTIONS_BY_PROFILE.items()
+    if sections
+}
+
 # Legacy compatibility - used when no profile is specified
 REQUIRED_FILES = ["CLAUDE.md", "LICENSE", "README.md", ".pre-commit-config.yaml", ".gitignore"]
 
@@ -169,18 +202,63 @@ MIN_HOOK_VERSIONS = {
     "https://github.com/gitleaks/gitleaks": "v8.0.0",
 }
 
+# Short display names for the hook repos above ("https://github.com/psf/black" -> "black")
+_SHORT_NAMES = {
+    url: url.rsplit("/", 1)[-1]
+    for url in REQUIRED_PRECOMMIT_HOOKS.keys() | MIN_HOOK_VERSIONS.keys()
+}
+
 # Expected license identifier
 EXPECTED_LICENSE = "GPL-3.0"
 LICENSE_PATTERNS = [
     r"GNU GENERAL PUBLIC LICENSE",
     r"Version 3,",  # Match "Version 3," to distinguish from v2
 ]
+# All markers fused into one anchored regex (a lookahead per pattern) for a single match call
+_LICENSE_RX = re.compile(
+    (r"\A" + "".join(f"(?=.*?{p})" for p in LICENSE_PATTERNS)).encode(), re.DOTALL
+)
+# The GPL-3.0 title and version line both appear within the first few hundred bytes
+LICENSE_HEADER_BYTES = 2048
+
+# Files at least this large are scanned through mmap instead of being read into memory
+MMAP_MIN_BYTES = 4096
+
+# Default worker count for --scan-dir (repository checks are I/O-bound)
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 4)
+
+# Scans of fewer repositories than this run serially; a thread pool costs more than it saves
+PARALLEL_MIN_REPOS = 4
 
 # URLs for template files
 TEMPLATE_URLS = {
     "LICENSE": "https://www.gnu.org/licenses/gpl-3.0.txt",
 }
 
+# Cached templates younger than this (in seconds) are used without revalidating
+TEMPLATE_CACHE_MAX_AGE = 30 * 86400
+
+# Bump when the report format changes so older cached reports are ignored
+REPORT_CACHE_VERSION = 1
+
+# Files whose contents the checks read; their mtime and size are part of the report cache key
+_REPORT_CACHE_INPUTS = (
+    "LICENSE",
+    "CLAUDE.md",
+    ".pre-commit-config.yaml",
+    ".git/hooks/pre-commit",
+    *CI_WORKFLOW_FILES,
+)
+
+# Marker in a repository's .git directory holding the HEAD sha it was last found compliant at
+COMPLIANT_MARKER = "pipe-works-compliant"
+
+# Editing or upgrading this script invalidates cached reports as well
+try:
+    _SCRIPT_MTIME = os.stat(__file__).st_mtime_ns
+except OSError:
+    _SCRIPT_MTIME = 0
+
 
 # =============================================================================
 # TEMPLATE CONTENT
@@ -401,6 +479,11 @@ jobs:
         run: echo "All CI checks passed!"
 """
 
+# Encoded once for init_repository, which writes them as bytes
+_GITIGNORE_BYTES = GITIGNORE_TEMPLATE.encode("utf-8")
+_PRECOMMIT_CONFIG_BYTES = PRECOMMIT_CONFIG_TEMPLATE.encode("utf-8")
+_CI_WORKFLOW_BYTES = CI_WORKFLOW_TEMPLATE.encode("utf-8")
+
 
 def get_claude_md_template(project_name: str) -> str:
     """Generate CLAUDE.md template with project name."""
@@ -512,7 +595,7 @@ Contributions are welcome! Please ensure your code passes all pre-commit hooks b
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CheckResult:
     """Result of a single compliance check."""
 
@@ -533,7 +616,7 @@ class CheckResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RepoReport:
     """Compliance report for a single repository."""
 
@@ -542,20 +625,47 @@ class RepoReport:
     checks: list[CheckResult] = field(default_factory=list)
     is_python_project: bool = False
     profile: str = PROFILE_PYTHON  # Default to Python for backwards compatibility
+    # Summary counts stored by finalize(); None means compute from checks on demand
+    _passed: int | None = field(default=None, init=False, repr=False, compare=False)
+    _total: int | None = field(default=None, init=False, repr=False, compare=False)
+    _compliant: bool | None = field(default=None, init=False, repr=False, compare=False)
+
+    def finalize(self) -> RepoReport:
+        """
+        Compute the summary counts once, in a single pass over the checks.
+
+        Call again after changing checks; until then the properties below
+        return the stored values.
+        """
+        passed = 0
+        compliant = True
+        for c in self.checks:
+            if c.passed:
+                passed += 1
+            elif c.severity == "error":
+                compliant = False
+        self._passed = passed
+        self._total = len(self.checks)
+        self._compliant = compliant
+        return self
 
     @property
     def passed_count(self) -> int:
         """Count of passed checks."""
+        if self._passed is not None:
+            return self._passed
         return sum(1 for c in self.checks if c.passed)
 
     @property
     def failed_count(self) -> int:
         """Count of failed checks."""
-        return sum(1 for c in self.checks if not c.passed)
+        return self.total_count - self.passed_count
 
     @property
     def total_count(self) -> int:
         """Total number of checks."""
+        if self._total is not None:
+            return self._total
         return len(self.checks)
 
     @property
@@ -568,6 +678,8 @@ class RepoReport:
     @property
     def is_compliant(self) -> bool:
         """True if all error-level checks passed."""
+        if self._compliant is not None:
+            return self._compliant
         return all(c.passed for c in self.checks if c.severity == "error")
 
     def to_dict(self) -> dict[str, Any]:
@@ -587,381 +699,554 @@ class RepoReport:
             },
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RepoReport:
+        """Rebuild a report from the output of to_dict()."""
+        return cls(
+            repo_path=Path(data["repo_path"]),
+            repo_name=data["repo_name"],
+            checks=[CheckResult(**check) for check in data["checks"]],
+            is_python_project=data["is_python_project"],
+            profile=data["profile"],
+        ).finalize()
+
+
+@dataclass(slots=True)
+class RepoIndex:
+    """
+    Cached directory listings for a single repository.
+
+    Each directory is read once with os.scandir() and its entries are kept by
+    name, so the checks below can test for files with a dict lookup instead of
+    issuing a stat() per path. Symlinks whose target does not exist are left
+    out, matching Path.exists(); only symlinks cost an extra stat() for this.
+    """
+
+    repo_path: Path
+    _listings: dict[str, dict[str, os.DirEntry[str]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def entries(self, subdir: str = "") -> dict[str, os.DirEntry[str]]:
+        """Entries of a repository subdirectory (empty if it is not a directory)."""
+        listing = self._listings.get(subdir)
+        if listing is None:
+            try:
+                with os.scandir(self.repo_path / subdir) as it:
+                    listing = {
+                        entry.name: entry
+                        for entry in it
+                        if not entry.is_symlink() or os.path.exists(entry.path)
+                    }
+            except OSError:
+                listing = {}
+            self._listings[subdir] = listing
+        return listing
+
+    def entry(self, relpath: str) -> os.DirEntry[str] | None:
+        """Directory entry for a repository-relative path such as '.github/workflows/ci.yml'."""
+        subdir, _, name = relpath.rpartition("/")
+        return self.entries(subdir).get(name)
+
+    def exists(self, relpath: str) -> bool:
+        """True if the repository-relative path exists."""
+        return self.entry(relpath) is not None
+
 
 # =============================================================================
 # COMPLIANCE CHECKS
 # =============================================================================
 
 
-def check_required_files(repo_path: Path, profile: str = PROFILE_PYTHON) -> list[CheckResult]:
+def check_required_files(
+    repo_path: Path, profile: str = PROFILE_PYTHON, index: RepoIndex | None = None
+) -> Iterator[CheckResult]:
     """Check that all required files exist based on project profile."""
-    results: list[CheckResult] = []
+    if index is None:
+        index = RepoIndex(repo_path)
 
     required_files = REQUIRED_FILES_BY_PROFILE.get(profile, REQUIRED_FILES)
+    # Required files are top-level, so one set intersection classifies them all
+    required_set = _REQUIRED_FILE_SETS.get(profile) or frozenset(required_files)
+    found = index.entries().keys() & required_set
 
     for filename in required_files:
-        file_path = repo_path / filename
-        if file_path.exists():
-            results.append(
-                CheckResult(
-                    name=f"file:{filename}",
-                    passed=True,
-                    message=f"{filename} exists",
-                )
+        if filename in found:
+            yield CheckResult(
+                name=f"file:{filename}",
+                passed=True,
+                message=f"{filename} exists",
             )
         else:
-            results.append(
-                CheckResult(
-                    name=f"file:{filename}",
-                    passed=False,
-                    message=f"{filename} is missing",
-                    severity="error",
-                )
+            yield CheckResult(
+                name=f"file:{filename}",
+                passed=False,
+                message=f"{filename} is missing",
+                severity="error",
             )
 
-    return results
-
 
-def check_python_project_files(repo_path: Path) -> list[CheckResult]:
+def check_python_project_files(
+    repo_path: Path, index: RepoIndex | None = None
+) -> Iterator[CheckResult]:
     """Check Python project configuration files."""
-    results: list[CheckResult] = []
+    if index is None:
+        index = RepoIndex(repo_path)
 
     # Check for pyproject.toml or setup.py
-    has_pyproject = (repo_path / "pyproject.toml").exists()
-    has_setup_py = (repo_path / "setup.py").exists()
+    has_pyproject = index.exists("pyproject.toml")
+    has_setup_py = index.exists("setup.py")
 
     if has_pyproject:
-        results.append(
-            CheckResult(
-                name="python:pyproject.toml",
-                passed=True,
-                message="pyproject.toml exists (modern Python project)",
-            )
+        yield CheckResult(
+            name="python:pyproject.toml",
+            passed=True,
+            message="pyproject.toml exists (modern Python project)",
         )
     elif has_setup_py:
-        results.append(
-            CheckResult(
-                name="python:setup.py",
-                passed=True,
-                message="setup.py exists (legacy Python project)",
-                severity="warning",
-            )
+        yield CheckResult(
+            name="python:setup.py",
+            passed=True,
+            message="setup.py exists (legacy Python project)",
+            severity="warning",
         )
     else:
-        results.append(
-            CheckResult(
-                name="python:project_config",
-                passed=False,
-                message="No pyproject.toml or setup.py found",
-                severity="error",
-            )
+        yield CheckResult(
+            name="python:project_config",
+            passed=False,
+            message="No pyproject.toml or setup.py found",
+            severity="error",
         )
 
-    return results
-
 
-def check_ci_workflows(repo_path: Path) -> list[CheckResult]:
+def check_ci_workflows(repo_path: Path, index: RepoIndex | None = None) -> Iterator[CheckResult]:
     """Check that required CI workflows exist."""
-    results: list[CheckResult] = []
+    if index is None:
+        index = RepoIndex(repo_path)
 
     for workflow_path in CI_WORKFLOW_FILES:
-        full_path = repo_path / workflow_path
-        if full_path.exists():
-            results.append(
-                CheckResult(
-                    name=f"ci:{workflow_path}",
-                    passed=True,
-                    message=f"CI workflow {workflow_path} exists",
-                )
+        if index.exists(workflow_path):
+            yield CheckResult(
+                name=f"ci:{workflow_path}",
+                passed=True,
+                message=f"CI workflow {workflow_path} exists",
             )
         else:
-            results.append(
-                CheckResult(
-                    name=f"ci:{workflow_path}",
-                    passed=False,
-                    message=f"CI workflow {workflow_path} is missing",
-                    severity="error",
-                )
+            yield CheckResult(
+                name=f"ci:{workflow_path}",
+                passed=False,
+                message=f"CI workflow {workflow_path} is missing",
+                severity="error",
             )
 
-    return results
-
 
-def check_license(repo_path: Path) -> list[CheckResult]:
+def check_license(repo_path: Path, index: RepoIndex | None = None) -> Iterator[CheckResult]:
     """Check that LICENSE file contains GPL-3.0."""
-    results: list[CheckResult] = []
-    license_path = repo_path / "LICENSE"
+    if index is None:
+        index = RepoIndex(repo_path)
+    license_entry = index.entry("LICENSE")
 
-    if not license_path.exists():
+    if license_entry is None:
         # Already checked in required files
-        return results
+        return
 
     try:
-        content = license_path.read_text()
-        is_gpl3 = all(re.search(pattern, content) for pattern in LICENSE_PATTERNS)
+        with open(license_entry.path, "rb") as f:
+            head = f.read(LICENSE_HEADER_BYTES)
+        is_gpl3 = _LICENSE_RX.match(head) is not None
+        if not is_gpl3 and len(head) == LICENSE_HEADER_BYTES:
+            # Non-standard layout: fall back to scanning the whole file
+            with _open_for_scan(license_entry.path) as content:
+                is_gpl3 = _LICENSE_RX.match(content) is not None
 
         if is_gpl3:
-            results.append(
-                CheckResult(
-                    name="license:gpl3",
-                    passed=True,
-                    message="LICENSE is GPL-3.0",
-                )
+            yield CheckResult(
+                name="license:gpl3",
+                passed=True,
+                message="LICENSE is GPL-3.0",
             )
         else:
-            results.append(
-                CheckResult(
-                    name="license:gpl3",
-                    passed=False,
-                    message="LICENSE does not appear to be GPL-3.0",
-                    severity="error",
-                )
-            )
-    except Exception as e:
-        results.append(
-            CheckResult(
-                name="license:readable",
+            yield CheckResult(
+                name="license:gpl3",
                 passed=False,
-                message=f"Could not read LICENSE: {e}",
+                message="LICENSE does not appear to be GPL-3.0",
                 severity="error",
             )
+    except Exception as e:
+        yield CheckResult(
+            name="license:readable",
+            passed=False,
+            message=f"Could not read LICENSE: {e}",
+            severity="error",
         )
 
-    return results
 
+def check_precommit_config(
+    repo_path: Path, index: RepoIndex | None = None, verbose: bool = False
+) -> Iterator[CheckResult]:
+    """
+    Check pre-commit configuration for required hooks.
 
-def check_precommit_config(repo_path: Path) -> list[CheckResult]:
-    """Check pre-commit configuration for required hooks."""
-    results: list[CheckResult] = []
-    config_path = repo_path / ".pre-commit-config.yaml"
+    Passing hooks are summarized per hook repo unless verbose is set.
+    """
+    if index is None:
+        index = RepoIndex(repo_path)
+    config_entry = index.entry(".pre-commit-config.yaml")
 
-    if not config_path.exists():
+    if config_entry is None:
         # Already checked in required files
-        return results
+        return
 
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        with open(config_entry.path, "rb") as f:
+            data = f.read()
+    except Exception as e:
+        yield CheckResult(
+            name="precommit:read",
+            passed=False,
+            message=f"Failed to read .pre-commit-config.yaml: {e}",
+            severity="error",
+        )
+        return
 
-        if not config or "repos" not in config:
-            results.append(
-                CheckResult(
-                    name="precommit:valid_config",
+    yield from _validate_precommit_config(data, verbose)
+
+
+def check_precommit_installed(
+    repo_path: Path, index: RepoIndex | None = None
+) -> Iterator[CheckResult]:
+    """Check if pre-commit hooks are installed in git."""
+    if index is None:
+        index = RepoIndex(repo_path)
+
+    if not index.exists(".git"):
+        yield CheckResult(
+            name="git:repository",
+            passed=False,
+            message="Not a git repository",
+            severity="warning",
+        )
+        return
+
+    hook_entry = index.entry(".git/hooks/pre-commit")
+
+    if hook_entry is not None:
+        # Check if it's a pre-commit hook (not a custom script); the generated
+        # script names pre-commit in its first lines, so one raw read is enough
+        try:
+            with open(hook_entry.path, "rb") as f:
+                content = f.read(io.DEFAULT_BUFFER_SIZE)
+            if b"pre-commit" in content:
+                yield CheckResult(
+                    name="precommit:installed",
+                    passed=True,
+                    message="Pre-commit hooks are installed",
+                )
+            else:
+                yield CheckResult(
+                    name="precommit:installed",
                     passed=False,
-                    message=".pre-commit-config.yaml is empty or invalid",
-                    severity="error",
+                    message="Git pre-commit hook exists but is not pre-commit",
+                    severity="warning",
                 )
+        except Exception:
+            yield CheckResult(
+                name="precommit:installed",
+                passed=False,
+                message="Could not read pre-commit hook",
+                severity="warning",
+            )
+    else:
+        yield CheckResult(
+            name="precommit:installed",
+            passed=False,
+            message="Pre-commit hooks not installed",
+            severity="error",
+            fix_command="pre-commit install",
+        )
+
+
+def check_claude_md_content(
+    repo_path: Path, profile: str = PROFILE_PYTHON, index: RepoIndex | None = None
+) -> Iterator[CheckResult]:
+    """Check CLAUDE.md for required sections based on project profile."""
+    if index is None:
+        index = RepoIndex(repo_path)
+    claude_md_entry = index.entry("CLAUDE.md")
+
+    if claude_md_entry is None:
+        # Already checked in required files
+        return
+
+    # Get section requirements for this profile
+    recommended_sections = CLAUDE_MD_SECTIONS_BY_PROFILE.get(profile, [])
+
+    # If no sections required for this profile, skip check
+    if not recommended_sections:
+        return
+
+    try:
+        found: set[int] = set()
+        with _open_for_scan(claude_md_entry.path) as content:
+            # One scan for all sections; lastgroup names the section that matched
+            for match in _CLAUDE_MD_SECTIONS_RX[profile].finditer(content):
+                found.add(int(match.lastgroup[1:]))  # type: ignore[index]
+                if len(found) == len(recommended_sections):
+                    break
+            # Matches cannot overlap, so confirm any section not seen on its own
+            for i, (_, pattern) in enumerate(recommended_sections):
+                if i not in found and pattern.search(content) is not None:
+                    found.add(i)
+
+        for i, (section_name, _) in enumerate(recommended_sections):
+            if i in found:
+                yield CheckResult(
+                    name=f"claude_md:{section_name.lower().replace(' ', '_')}",
+                    passed=True,
+                    message=f"CLAUDE.md has '{section_name}' section",
+                )
+            else:
+                yield CheckResult(
+                    name=f"claude_md:{section_name.lower().replace(' ', '_')}",
+                    passed=False,
+                    message=f"CLAUDE.md missing '{section_name}' section",
+                    severity="warning",
+                )
+
+    except Exception as e:
+        yield CheckResult(
+            name="claude_md:readable",
+            passed=False,
+            message=f"Could not read CLAUDE.md: {e}",
+            severity="warning",
+        )
+
+
+@contextlib.contextmanager
+def _open_for_scan(path: str) -> Iterator[bytes | mmap.mmap]:
+    """
+    Open a file for regex scanning.
+
+    Small files are read into a bytes object; larger ones are memory-mapped so
+    the regex engine scans the page cache directly instead of a heap copy.
+    Match objects must not be used once the context exits and the map is closed.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            yield f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
+
+def _parse_precommit_yaml(content: bytes) -> Any:
+    """Parse pre-commit config content with PyYAML's safe loader."""
+    import yaml  # type: ignore[import-untyped]
+
+    # Prefer the libyaml-backed loader; the pure-Python one is an order of magnitude slower
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    # A named stream makes parse errors point at the file instead of "<byte string>"
+    stream = io.BytesIO(content)
+    stream.name = ".pre-commit-config.yaml"
+    return yaml.load(stream, Loader=loader)  # nosec B506 - always a safe loader
+
+
+def _check_precommit_content(data: bytes, verbose: bool = False) -> Iterator[CheckResult]:
+    """Parse pre-commit config content and validate its hooks and versions."""
+    import yaml  # type: ignore[import-untyped]
+
+    try:
+        config = _parse_precommit_yaml(data)
+
+        if not config or "repos" not in config:
+            yield CheckResult(
+                name="precommit:valid_config",
+                passed=False,
+                message=".pre-commit-config.yaml is empty or invalid",
+                severity="error",
             )
-            return results
+            return
 
         # Build a map of configured hooks
-        configured_hooks: dict[str, list[str]] = {}
+        configured_hooks: dict[str, frozenset[str]] = {}
         configured_versions: dict[str, str] = {}
 
         for repo in config.get("repos", []):
             repo_url = repo.get("repo", "")
             rev = repo.get("rev", "")
-            hooks = [h.get("id", "") for h in repo.get("hooks", [])]
+            hooks = frozenset(h.get("id", "") for h in repo.get("hooks", []))
 
             configured_hooks[repo_url] = hooks
             configured_versions[repo_url] = rev
 
-        # Check required hooks
-        for repo_url, required_hook_ids in REQUIRED_PRECOMMIT_HOOKS.items():
-            if repo_url not in configured_hooks:
-                results.append(
-                    CheckResult(
-                        name=f"precommit:repo:{repo_url.split('/')[-1]}",
-                        passed=False,
-                        message=f"Missing pre-commit repo: {repo_url}",
-                        severity="error",
-                    )
-                )
-                continue
-
-            for hook_id in required_hook_ids:
-                if hook_id in configured_hooks[repo_url]:
-                    results.append(
-                        CheckResult(
-                            name=f"precommit:hook:{hook_id}",
-                            passed=True,
-                            message=f"Hook '{hook_id}' is configured",
-                        )
-                    )
-                else:
-                    results.append(
-                        CheckResult(
-                            name=f"precommit:hook:{hook_id}",
-                            passed=False,
-                            message=f"Hook '{hook_id}' is not configured",
-                            severity="error",
-                        )
-                    )
-
-        # Check minimum versions
-        for repo_url, min_version in MIN_HOOK_VERSIONS.items():
-            if repo_url in configured_versions:
-                current_version = configured_versions[repo_url]
-                # Simple version comparison (strip 'v' prefix)
-                current_clean = current_version.lstrip("v")
-                min_clean = min_version.lstrip("v")
-
-                # This is a simplified comparison - may not work for all version formats
-                try:
-                    if _compare_versions(current_clean, min_clean) >= 0:
-                        results.append(
-                            CheckResult(
-                                name=f"precommit:version:{repo_url.split('/')[-1]}",
-                                passed=True,
-                                message=f"Version {current_version} >= {min_version}",
-                            )
-                        )
-                    else:
-                        results.append(
-                            CheckResult(
-                                name=f"precommit:version:{repo_url.split('/')[-1]}",
-                                passed=False,
-                                message=f"Version {current_version} < {min_version} (update recommended)",
-                                severity="warning",
-                                fix_command="pre-commit autoupdate",
-                            )
-                        )
-                except ValueError:
-                    # Version comparison failed, skip
-                    pass
+        for name, passed, message, severity, fix_command in _validate_hooks(
+            configured_hooks, configured_versions, verbose
+        ):
+            yield CheckResult(name, passed, message, severity, fix_command)
 
     except yaml.YAMLError as e:
-        results.append(
-            CheckResult(
-                name="precommit:parse",
-                passed=False,
-                message=f"Failed to parse .pre-commit-config.yaml: {e}",
-                severity="error",
-            )
+        yield CheckResult(
+            name="precommit:parse",
+            passed=False,
+            message=f"Failed to parse .pre-commit-config.yaml: {e}",
+            severity="error",
         )
     except Exception as e:
-        results.append(
-            CheckResult(
-                name="precommit:read",
-                passed=False,
-                message=f"Failed to read .pre-commit-config.yaml: {e}",
-                severity="error",
-            )
+        yield CheckResult(
+            name="precommit:read",
+            passed=False,
+            message=f"Failed to read .pre-commit-config.yaml: {e}",
+            severity="error",
         )
 
-    return results
 
+# (name, passed, message, severity, fix_command) - a CheckResult without the object
+_ResultTuple = tuple[str, bool, str, str, str | None]
 
-def check_precommit_installed(repo_path: Path) -> list[CheckResult]:
-    """Check if pre-commit hooks are installed in git."""
-    results: list[CheckResult] = []
 
-    hook_path = repo_path / ".git" / "hooks" / "pre-commit"
+def _validate_hooks(
+    configured_hooks: dict[str, frozenset[str]],
+    configured_versions: dict[str, str],
+    verbose: bool = False,
+) -> list[_ResultTuple]:
+    """
+    Validate configured pre-commit hooks and revs against the org requirements.
 
-    if not (repo_path / ".git").exists():
-        results.append(
-            CheckResult(
-                name="git:repository",
-                passed=False,
-                message="Not a git repository",
-                severity="warning",
+    Pure dict and string work with no I/O or CheckResult objects, kept fully
+    typed so it can be compiled with mypyc if this loop ever becomes hot.
+
+    Unless verbose, a repo whose required hooks are all configured produces a
+    single passing result; otherwise only its missing hooks are listed.
+    """
+    results: list[_ResultTuple] = []
+
+    # Check required hooks
+    for repo_url, required_hook_ids in REQUIRED_PRECOMMIT_HOOKS.items():
+        hooks = configured_hooks.get(repo_url)
+        if hooks is None:
+            results.append(
+                (
+                    f"precommit:repo:{_SHORT_NAMES[repo_url]}",
+                    False,
+                    f"Missing pre-commit repo: {repo_url}",
+                    "error",
+                    None,
+                )
             )
-        )
-        return results
+            continue
 
-    if hook_path.exists():
-        # Check if it's a pre-commit hook (not a custom script)
-        try:
-            content = hook_path.read_text()
-            if "pre-commit" in content:
+        if not verbose and all(hook_id in hooks for hook_id in required_hook_ids):
+            results.append(
+                (
+                    f"precommit:repo:{_SHORT_NAMES[repo_url]}",
+                    True,
+                    f"Required {_SHORT_NAMES[repo_url]} hooks configured: "
+                    + ", ".join(required_hook_ids),
+                    "error",
+                    None,
+                )
+            )
+            continue
+
+        for hook_id in required_hook_ids:
+            if hook_id in hooks:
+                if not verbose:
+                    continue
                 results.append(
-                    CheckResult(
-                        name="precommit:installed",
-                        passed=True,
-                        message="Pre-commit hooks are installed",
+                    (
+                        f"precommit:hook:{hook_id}",
+                        True,
+                        f"Hook '{hook_id}' is configured",
+                        "error",
+                        None,
                     )
                 )
             else:
                 results.append(
-                    CheckResult(
-                        name="precommit:installed",
-                        passed=False,
-                        message="Git pre-commit hook exists but is not pre-commit",
-                        severity="warning",
+                    (
+                        f"precommit:hook:{hook_id}",
+                        False,
+                        f"Hook '{hook_id}' is not configured",
+                        "error",
+                        None,
                     )
                 )
-        except Exception:
-            results.append(
-                CheckResult(
-                    name="precommit:installed",
-                    passed=False,
-                    message="Could not read pre-commit hook",
-                    severity="warning",
-                )
-            )
-    else:
-        results.append(
-            CheckResult(
-                name="precommit:installed",
-                passed=False,
-                message="Pre-commit hooks not installed",
-                severity="error",
-                fix_command="pre-commit install",
-            )
-        )
 
-    return results
+    # Check minimum versions
+    for repo_url, min_version in MIN_HOOK_VERSIONS.items():
+        if repo_url in configured_versions:
+            current_version = configured_versions[repo_url]
+            # Simple version comparison (strip 'v' prefix)
+            current_clean = current_version.lstrip("v")
+            min_clean = min_version.lstrip("v")
 
+            try:
+                if _compare_versions(current_clean, min_clean) >= 0:
+                    results.append(
+                        (
+                            f"precommit:version:{_SHORT_NAMES[repo_url]}",
+                            True,
+                            f"Version {current_version} >= {min_version}",
+                            "error",
+                            None,
+                        )
+                    )
+                else:
+                    results.append(
+                        (
+                            f"precommit:version:{_SHORT_NAMES[repo_url]}",
+                            False,
+                            f"Version {current_version} < {min_version} (update recommended)",
+                            "warning",
+                            "pre-commit autoupdate",
+                        )
+                    )
+            except ValueError:
+                # Version comparison failed, skip
+                pass
 
-def check_claude_md_content(repo_path: Path, profile: str = PROFILE_PYTHON) -> list[CheckResult]:
-    """Check CLAUDE.md for required sections based on project profile."""
-    results: list[CheckResult] = []
-    claude_md_path = repo_path / "CLAUDE.md"
+    return results
 
-    if not claude_md_path.exists():
-        # Already checked in required files
-        return results
 
-    # Get section requirements for this profile
-    recommended_sections = CLAUDE_MD_SECTIONS_BY_PROFILE.get(profile, [])
+# Validation results for pre-commit configs, keyed by a digest of the file bytes
+PRECOMMIT_RESULTS_CACHE_SIZE = 512
+_precommit_results: dict[tuple[bytes, bool], tuple[CheckResult, ...]] = {}
+_precommit_results_lock = threading.Lock()
 
-    # If no sections required for this profile, skip check
-    if not recommended_sections:
-        return results
 
-    try:
-        content = claude_md_path.read_text()
+def _validate_precommit_config(data: bytes, verbose: bool = False) -> tuple[CheckResult, ...]:
+    """
+    Validate pre-commit config content, reusing results for identical files.
 
-        for section_name, pattern in recommended_sections:
-            if re.search(pattern, content):
-                results.append(
-                    CheckResult(
-                        name=f"claude_md:{section_name.lower().replace(' ', '_')}",
-                        passed=True,
-                        message=f"CLAUDE.md has '{section_name}' section",
-                    )
-                )
-            else:
-                results.append(
-                    CheckResult(
-                        name=f"claude_md:{section_name.lower().replace(' ', '_')}",
-                        passed=False,
-                        message=f"CLAUDE.md missing '{section_name}' section",
-                        severity="warning",
-                    )
-                )
+    Most repositories carry byte-identical copies of the organization
+    template, so results are cached under a BLAKE2b digest of the raw bytes
+    and the YAML parse and validation run once per distinct config. The
+    cache keeps only the digests, evicting the oldest entry when full.
+    """
+    key = (hashlib.blake2b(data, digest_size=16).digest(), verbose)
+    with _precommit_results_lock:
+        results = _precommit_results.get(key)
+    if results is None:
+        results = tuple(_check_precommit_content(data, verbose))
+        with _precommit_results_lock:
+            if len(_precommit_results) >= PRECOMMIT_RESULTS_CACHE_SIZE:
+                del _precommit_results[next(iter(_precommit_results))]
+            _precommit_results[key] = results
+    return results
 
-    except Exception as e:
-        results.append(
-            CheckResult(
-                name="claude_md:readable",
-                passed=False,
-                message=f"Could not read CLAUDE.md: {e}",
-                severity="warning",
-            )
-        )
 
-    return results
+@lru_cache(maxsize=256)
+def _parse_version(version: str) -> Version:
+    """
+    Parse a PEP 440 version string.
+
+    Raises:
+        ValueError: If the version cannot be parsed, e.g. a commit SHA.
+    """
+    try:
+        return Version(version)
+    except InvalidVersion as e:
+        raise ValueError(str(e)) from e
 
 
 def _compare_versions(v1: str, v2: str) -> int:
@@ -972,23 +1257,13 @@ def _compare_versions(v1: str, v2: str) -> int:
         -1 if v1 < v2
         0 if v1 == v2
         1 if v1 > v2
-    """
-    # Split by . and compare each part
-    parts1 = [int(x) for x in re.split(r"[.\-]", v1) if x.isdigit()]
-    parts2 = [int(x) for x in re.split(r"[.\-]", v2) if x.isdigit()]
-
-    # Pad shorter version with zeros
-    max_len = max(len(parts1), len(parts2))
-    parts1.extend([0] * (max_len - len(parts1)))
-    parts2.extend([0] * (max_len - len(parts2)))
-
-    for p1, p2 in zip(parts1, parts2, strict=True):
-        if p1 < p2:
-            return -1
-        if p1 > p2:
-            return 1
 
-    return 0
+    Raises:
+        ValueError: If either version cannot be parsed.
+    """
+    key1 = _parse_version(v1)
+    key2 = _parse_version(v2)
+    return int(key1 > key2) - int(key1 < key2)
 
 
 # =============================================================================
@@ -996,7 +1271,21 @@ def _compare_versions(v1: str, v2: str) -> int:
 # =============================================================================
 
 
-def detect_profile(repo_path: Path) -> str:
+def _exists(base: str, name: str) -> bool:
+    """True if base/name exists; a single lstat() with no Path objects involved."""
+    return os.path.lexists(os.path.join(base, name))
+
+
+def _entry_set(path: Path) -> frozenset[str]:
+    """Names of the entries in a directory (empty if it cannot be listed)."""
+    try:
+        with os.scandir(path) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+
+
+def detect_profile(repo_path: Path, entries: Collection[str] | None = None) -> str:
     """
     Detect the project profile based on repository characteristics.
 
@@ -1006,8 +1295,12 @@ def detect_profile(repo_path: Path) -> str:
     - static_site: HTML/CSS/JS websites
     - documentation: Documentation-only repos (default fallback)
 
+    Detection is a set test against the top-level listing, so it is not
+    memoized; pass entries when the directory has already been listed.
+
     Args:
-        repo_path: Path to the repository root.
+        repo_path: Absolute path to the repository root.
+        entries: Top-level entry names of the repository, if already listed.
 
     Returns:
         Profile string (PROFILE_PYTHON, PROFILE_STATIC_SITE, etc.)
@@ -1018,33 +1311,210 @@ def detect_profile(repo_path: Path) -> str:
     if repo_name == ".github":
         return PROFILE_ORG_CONFIG
 
-    # Check for Python project indicators
-    for indicator in PROFILE_INDICATORS[PROFILE_PYTHON]:
-        if (repo_path / indicator).exists():
-            return PROFILE_PYTHON
+    # One directory listing answers every indicator probe
+    if entries is None:
+        entries = _entry_set(repo_path)
+
+    # Check for Python project indicators (these win over static site ones)
+    if not _PY_IND.isdisjoint(entries):
+        return PROFILE_PYTHON
 
     # Check for static site indicators (HTML/JS project)
-    for indicator in PROFILE_INDICATORS[PROFILE_STATIC_SITE]:
-        if (repo_path / indicator).exists():
-            return PROFILE_STATIC_SITE
+    if not _SS_IND.isdisjoint(entries):
+        return PROFILE_STATIC_SITE
 
     # Default to documentation profile
     return PROFILE_DOCUMENTATION
 
 
-def is_python_project(repo_path: Path) -> bool:
+def is_python_project(repo_path: Path, entries: Collection[str] | None = None) -> bool:
     """Determine if a repository is a Python project."""
-    indicators = [
-        "pyproject.toml",
-        "setup.py",
-        "setup.cfg",
-        "requirements.txt",
-        "Pipfile",
+    if entries is None:
+        entries = _entry_set(repo_path)
+    return not _PY_IND.isdisjoint(entries)
+
+
+# Checks that can be re-run on their own after their fix was applied. Fixes for
+# anything else (e.g. pre-commit autoupdate rewriting .pre-commit-config.yaml)
+# can affect other checks, so they trigger a full check_repository instead.
+CHECK_DISPATCH: dict[str, Callable[[Path, RepoIndex], Iterator[CheckResult]]] = {
+    "precommit:installed": check_precommit_installed,
+}
+
+
+def _git_head(index: RepoIndex) -> str | None:
+    """
+    Commit sha of the repository's HEAD, or None if git cannot tell.
+
+    A regular .git directory is read directly, and a path without .git has
+    no HEAD. git itself is only run when .git is a file, as in worktrees
+    and submodules.
+    """
+    git_entry = index.entry(".git")
+    if git_entry is None:
+        return None
+    if git_entry.is_dir():
+        return _read_head_sha(Path(git_entry.path))
+    if not git_entry.is_file():
+        return None
+
+    import subprocess  # nosec B404 - only needed when .git is a file
+
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(index.repo_path), "rev-parse", "HEAD"],  # nosec B603 B607
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _read_head_sha(git_dir: Path) -> str | None:
+    """
+    Commit sha of HEAD, read straight from the .git directory.
+
+    Follows a symbolic ref through its loose ref file, then packed-refs.
+    Returns None when HEAD cannot be resolved this way (for example when
+    .git is a worktree link file).
+    """
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref: "):
+            return head or None
+        ref = head[5:]
+        try:
+            return (git_dir / ref).read_text(encoding="utf-8").strip() or None
+        except FileNotFoundError:
+            pass
+        with open(git_dir / "packed-refs", encoding="utf-8") as f:
+            for line in f:
+                sha, _, name = line.rstrip("\n").partition(" ")
+                if name == ref:
+                    return sha
+    except OSError:
+        pass
+    return None
+
+
+def _file_stamp(index: RepoIndex, relpath: str) -> tuple[int, int] | None:
+    """(mtime_ns, size) of a repository file, or None if it does not exist."""
+    entry = index.entry(relpath)
+    try:
+        stat = entry.stat() if entry is not None else None
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size) if stat is not None else None
+
+
+def _compliant_marker(index: RepoIndex, head: str) -> str:
+    """
+    Contents of the compliant marker for the repository's current state.
+
+    Besides HEAD it covers the checker version and the git pre-commit hook,
+    which lives outside the commit, so upgrading the checker or removing the
+    hook forces a full check again.
+    """
+    return repr(
+        (
+            head,
+            REPORT_CACHE_VERSION,
+            _SCRIPT_MTIME,
+            _file_stamp(index, ".git/hooks/pre-commit"),
+        )
+    )
+
+
+def _compliant_marker_report(
+    repo_path: Path, index: RepoIndex, head: str, marker: str
+) -> RepoReport | None:
+    """Synthetic report if the repository was found compliant in this state before."""
+    try:
+        recorded = (repo_path / ".git" / COMPLIANT_MARKER).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if recorded != marker:
+        return None
+
+    profile = detect_profile(repo_path, index.entries().keys())
+    return RepoReport(
+        repo_path=repo_path,
+        repo_name=repo_path.name,
+        checks=[
+            CheckResult(
+                name="cache:compliant",
+                passed=True,
+                message=(
+                    f"Compliant at commit {head[:12]} (cached; uncommitted changes not checked)"
+                ),
+                severity="info",
+            )
+        ],
+        is_python_project=(profile == PROFILE_PYTHON),
+        profile=profile,
+    ).finalize()
+
+
+def _mark_compliant(repo_path: Path, marker: str) -> None:
+    """Record that the repository is compliant in this state, ignoring write failures."""
+    with contextlib.suppress(OSError):
+        (repo_path / ".git" / COMPLIANT_MARKER).write_text(marker, encoding="utf-8")
+
+
+def _report_cache_key(index: RepoIndex, verbose: bool) -> str:
+    """
+    Fingerprint of everything a repository's report depends on.
+
+    Covers the checked-out commit, the top-level file names (which decide the
+    profile and the required-file checks) and the mtime and size of every
+    file whose contents a check reads, so uncommitted edits also change it.
+    """
+    parts: list[object] = [
+        REPORT_CACHE_VERSION,
+        _SCRIPT_MTIME,
+        verbose,
+        _git_head(index),
+        sorted(index.entries()),
     ]
-    return any((repo_path / f).exists() for f in indicators)
+    parts.extend(_file_stamp(index, relpath) for relpath in _REPORT_CACHE_INPUTS)
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+def _report_cache_path(repo_path: Path) -> Path:
+    """Location of the cached report for a repository."""
+    digest = hashlib.sha1(os.fsencode(repo_path), usedforsecurity=False).hexdigest()
+    return _cache_dir() / "reports" / f"{digest}.json"
+
+
+def _load_cached_report(cache_path: Path, key: str) -> RepoReport | None:
+    """Cached report stored under the given key, or None on a miss."""
+    try:
+        data = json.loads(cache_path.read_bytes())
+        if data.get("key") == key:
+            return RepoReport.from_dict(data["report"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    return None
 
 
-def check_repository(repo_path: Path) -> RepoReport:
+def _store_cached_report(cache_path: Path, key: str, report: RepoReport) -> None:
+    """Save a report to the cache, ignoring any failure to write it."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write_text(cache_path, json.dumps({"key": key, "report": report.to_dict()}))
+    except OSError:
+        pass
+
+
+def check_repository(
+    repo_path: Path,
+    verbose: bool = False,
+    use_cache: bool = False,
+    already_resolved: bool = False,
+    cache_compliant: bool = False,
+) -> RepoReport:
     """
     Run all compliance checks on a repository.
 
@@ -1056,14 +1526,43 @@ def check_repository(repo_path: Path) -> RepoReport:
 
     Args:
         repo_path: Path to the repository root.
+        verbose: List every passing pre-commit hook instead of one result per hook repo.
+        use_cache: Reuse the report saved by an earlier run when nothing it
+            depends on has changed, and save the new report otherwise.
+        already_resolved: repo_path is known to be absolute and free of
+            symlinks, so resolving it again can be skipped.
+        cache_compliant: Skip the checks for a repository whose HEAD, git
+            pre-commit hook and checker version are unchanged since it was
+            last found compliant, and record that state when it is found
+            compliant. Uncommitted changes to tracked files are not noticed.
 
     Returns:
         RepoReport with all check results.
     """
-    repo_path = repo_path.resolve()
-
-    # Detect project profile
-    profile = detect_profile(repo_path)
+    if not already_resolved:
+        repo_path = repo_path.resolve()
+
+    # List each directory once and share the listing between all checks
+    index = RepoIndex(repo_path)
+
+    head = _read_head_sha(repo_path / ".git") if cache_compliant else None
+    marker = _compliant_marker(index, head) if head is not None else None
+    if head is not None and marker is not None:
+        marked = _compliant_marker_report(repo_path, index, head, marker)
+        if marked is not None:
+            return marked
+
+    if use_cache:
+        cache_key = _report_cache_key(index, verbose)
+        cache_path = _report_cache_path(repo_path)
+        cached = _load_cached_report(cache_path, cache_key)
+        if cached is not None:
+            if marker is not None and cached.is_compliant:
+                _mark_compliant(repo_path, marker)
+            return cached
+
+    # Detect project profile from the top-level listing
+    profile = detect_profile(repo_path, index.entries().keys())
 
     report = RepoReport(
         repo_path=repo_path,
@@ -1073,44 +1572,118 @@ def check_repository(repo_path: Path) -> RepoReport:
     )
 
     # Run profile-appropriate checks
-    report.checks.extend(check_required_files(repo_path, profile))
-    report.checks.extend(check_license(repo_path))
+    report.checks.extend(check_required_files(repo_path, profile, index))
+    report.checks.extend(check_license(repo_path, index))
 
     # CI workflow check (only for profiles that require it)
-    if CI_REQUIRED_BY_PROFILE.get(profile, False):
-        report.checks.extend(check_ci_workflows(repo_path))
+    if profile in _CI_REQUIRED:
+        report.checks.extend(check_ci_workflows(repo_path, index))
 
     # Pre-commit checks (only for profiles that require it)
-    if PRECOMMIT_REQUIRED_BY_PROFILE.get(profile, False):
-        report.checks.extend(check_precommit_config(repo_path))
-        report.checks.extend(check_precommit_installed(repo_path))
+    if profile in _PRECOMMIT_REQUIRED:
+        report.checks.extend(check_precommit_config(repo_path, index, verbose))
+        report.checks.extend(check_precommit_installed(repo_path, index))
 
     # CLAUDE.md content check (sections based on profile)
-    report.checks.extend(check_claude_md_content(repo_path, profile))
+    report.checks.extend(check_claude_md_content(repo_path, profile, index))
 
     # Python-specific checks
     if profile == PROFILE_PYTHON:
-        report.checks.extend(check_python_project_files(repo_path))
+        report.checks.extend(check_python_project_files(repo_path, index))
+
+    report.finalize()
+
+    if use_cache:
+        _store_cached_report(cache_path, cache_key, report)
+
+    if marker is not None and report.is_compliant:
+        _mark_compliant(repo_path, marker)
 
     return report
 
 
-def scan_directory(dir_path: Path) -> list[RepoReport]:
+def recheck(
+    report: RepoReport, fixed: set[str], verbose: bool = False, use_cache: bool = False
+) -> RepoReport:
+    """
+    Bring a report up to date after fixes were applied.
+
+    Only the fixed checks are run again when all of them are listed in
+    CHECK_DISPATCH, and their results replace the old ones in place. Otherwise
+    the whole repository is checked again.
+
+    Args:
+        report: The report the fixes were applied from.
+        fixed: Names of the checks whose fix succeeded, as returned by apply_fixes.
+        verbose: Passed through to check_repository.
+        use_cache: Passed through to check_repository.
+
+    Returns:
+        The updated report, or a new one after a full re-check.
+    """
+    if not fixed:
+        return report
+    if not fixed <= CHECK_DISPATCH.keys():
+        return check_repository(report.repo_path, verbose, use_cache, already_resolved=True)
+
+    index = RepoIndex(report.repo_path)
+    fresh: dict[str, CheckResult] = {}
+    for check_fn in dict.fromkeys(CHECK_DISPATCH[name] for name in fixed):
+        for result in check_fn(report.repo_path, index):
+            fresh[result.name] = result
+    report.checks[:] = [fresh.get(check.name, check) for check in report.checks]
+    return report.finalize()
+
+
+def scan_directory(
+    dir_path: Path,
+    jobs: int = DEFAULT_JOBS,
+    verbose: bool = False,
+    use_cache: bool = False,
+    cache_compliant: bool = False,
+) -> list[RepoReport]:
     """
     Scan a directory for repositories and check each one.
 
+    Repositories are checked concurrently in a thread pool; each check only
+    touches its own repository and returns a fresh RepoReport. Scans of fewer
+    than PARALLEL_MIN_REPOS repositories, or with jobs <= 1, run serially.
+
     Args:
         dir_path: Path to directory containing repositories.
+        jobs: Maximum number of repositories to check concurrently.
+        verbose: Passed through to check_repository.
+        use_cache: Passed through to check_repository.
+        cache_compliant: Passed through to check_repository.
 
     Returns:
-        List of RepoReports for each repository found.
+        List of RepoReports for each repository found, sorted by directory name.
     """
-    reports = []
-
-    for item in sorted(dir_path.iterdir()):
-        if item.is_dir() and (item / ".git").exists():
-            report = check_repository(item)
-            reports.append(report)
+    # Children of a resolved directory are resolved already, unless they are symlinks
+    base = dir_path.resolve()
+
+    # DirEntry.is_dir() answers from the directory listing for anything but a
+    # symlink; symlinked repositories are still followed, as before
+    with os.scandir(base) as it:
+        dirs = [entry for entry in it if entry.is_dir()]
+    # Probe for .git before sorting so only repositories are sorted and kept
+    repos = [entry for entry in dirs if _exists(entry.path, ".git")]
+    repos.sort(key=lambda e: e.name)
+    if not repos:
+        return []
+
+    args = (
+        [base / entry.name for entry in repos],
+        [verbose] * len(repos),
+        [use_cache] * len(repos),
+        [not entry.is_symlink() for entry in repos],
+        [cache_compliant] * len(repos),
+    )
+    if jobs <= 1 or len(repos) < PARALLEL_MIN_REPOS:
+        reports = list(map(check_repository, *args))
+    else:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(repos))) as executor:
+            reports = list(executor.map(check_repository, *args))
 
     return reports
 
@@ -1120,6 +1693,16 @@ def scan_directory(dir_path: Path) -> list[RepoReport]:
 # =============================================================================
 
 
+def _format_check(check: CheckResult) -> str:
+    """Text report line for one check, followed by its fix line if it has one."""
+    if check.passed:
+        return f"  ✓ {check.message}"
+    severity_marker = " (warning)" if check.severity == "warning" else ""
+    if check.fix_command:
+        return f"  ✗ {check.message}{severity_marker}\n      Fix: {check.fix_command}"
+    return f"  ✗ {check.message}{severity_marker}"
+
+
 def format_text_report(report: RepoReport) -> str:
     """Format a report as human-readable text."""
     # Format profile name for display
@@ -1136,24 +1719,15 @@ def format_text_report(report: RepoReport) -> str:
     ]
 
     # Group checks by category
-    categories: dict[str, list[CheckResult]] = {}
+    categories: defaultdict[str, list[CheckResult]] = defaultdict(list)
     for check in report.checks:
-        category = check.name.split(":")[0]
-        if category not in categories:
-            categories[category] = []
-        categories[category].append(check)
-
-    for category, checks in categories.items():
-        lines.append(f"[{category.upper()}]")
-        for check in checks:
-            icon = "✓" if check.passed else "✗"
-            severity_marker = ""
-            if not check.passed and check.severity == "warning":
-                severity_marker = " (warning)"
-            lines.append(f"  {icon} {check.message}{severity_marker}")
-            if check.fix_command and not check.passed:
-                lines.append(f"      Fix: {check.fix_command}")
-        lines.append("")
+        categories[check.name.partition(":")[0]].append(check)
+
+    # One block per category: header, check lines and a trailing blank line
+    lines.extend(
+        f"[{category.upper()}]\n" + "\n".join(map(_format_check, checks)) + "\n"
+        for category, checks in categories.items()
+    )
 
     # Summary
     lines.append("-" * 60)
@@ -1177,7 +1751,16 @@ def format_json_report(reports: list[RepoReport]) -> str:
             "non_compliant_repos": sum(1 for r in reports if not r.is_compliant),
         },
     }
-    return json.dumps(data, indent=2)
+    # orjson is optional and only imported here, so text output doesn't pay for it
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data, indent=2)
+    try:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    except orjson.JSONEncodeError:
+        # Paths that aren't valid UTF-8 hold surrogates, which orjson rejects
+        return json.dumps(data, indent=2)
 
 
 # =============================================================================
@@ -1185,39 +1768,225 @@ def format_json_report(reports: list[RepoReport]) -> str:
 # =============================================================================
 
 
-def apply_fixes(repo_path: Path, report: RepoReport) -> list[str]:
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write a file by renaming a fully written temporary file over it.
+
+    Readers, and later runs after an interruption, see either no file or the
+    complete contents, never a partial write.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Atomically write text as UTF-8; see _atomic_write_bytes."""
+    _atomic_write_bytes(path, text.encode("utf-8"))
+
+
+def _cache_dir() -> Path:
+    """Directory for locally cached downloads."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pipe-works"
+
+
+@cache
+def _fetch_template(url: str) -> str:
+    """
+    Download a template file, revalidating a copy cached on disk.
+
+    The cache file is named after the last component of the URL, with the
+    response's ETag and Last-Modified validators kept next to it. A copy
+    younger than TEMPLATE_CACHE_MAX_AGE is used without touching the network.
+    An older one is revalidated with a conditional GET, so an unchanged
+    template costs a 304 instead of a full download, and is reused as-is when
+    the server cannot be reached. Results are also memoized for the life of
+    the process.
+    """
+    import urllib.request
+
+    cache_path = _cache_dir() / url.rsplit("/", 1)[-1]
+    meta_path = cache_path.with_name(cache_path.name + ".json")
+
+    cached: str | None = None
+    meta: dict[str, str] = {}
+    age = float("inf")
+    with contextlib.suppress(OSError):
+        age = time.time() - cache_path.stat().st_mtime
+        cached = cache_path.read_text(encoding="utf-8")
+        with contextlib.suppress(OSError, ValueError):
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    if cached is not None and meta.get("url") == url and age < TEMPLATE_CACHE_MAX_AGE:
+        return cached
+
+    request = urllib.request.Request(url)
+    if cached is not None and meta.get("url") == url:
+        if meta.get("etag"):
+            request.add_header("If-None-Match", meta["etag"])
+        if meta.get("last_modified"):
+            request.add_header("If-Modified-Since", meta["last_modified"])
+
+    try:
+        with urllib.request.urlopen(request) as response:  # nosec B310
+            content: str = response.read().decode("utf-8")
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+    except OSError as e:
+        # 304 Not Modified is raised as an HTTPError; so is any other failure
+        if cached is not None:
+            if getattr(e, "code", None) == 304:
+                # Still current: restart the max-age window
+                with contextlib.suppress(OSError):
+                    os.utime(cache_path)
+            return cached
+        raise
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {"url": url, "etag": etag or "", "last_modified": last_modified or ""}
+        # A concurrent reader never sees a partially written template
+        _atomic_write_text(cache_path, content)
+        meta_path.write_text(json.dumps(meta), encoding="utf-8")
+    except OSError:
+        # Caching is best-effort; a read-only home directory is not an error
+        pass
+
+    return content
+
+
+# In-process pre-commit runs change the working directory and redirect the
+# standard output file descriptors, all of which are process-wide
+_PRECOMMIT_LOCK = threading.Lock()
+
+
+@contextlib.contextmanager
+def _redirect_output(stderr_file: IO[bytes]) -> Iterator[None]:
+    """
+    Discard file descriptor 1 and send descriptor 2 to stderr_file.
+
+    Works at the descriptor level because pre-commit writes to the
+    sys.stdout.buffer object it bound at import time, and its hooks run as
+    child processes. Callers must hold _PRECOMMIT_LOCK, and nothing else may
+    print meanwhile.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_stdout, saved_stderr = os.dup(1), os.dup(2)
+    try:
+        with open(os.devnull, "wb") as devnull:
+            os.dup2(devnull.fileno(), 1)
+        os.dup2(stderr_file.fileno(), 2)
+        yield
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(saved_stdout, 1)
+        os.dup2(saved_stderr, 2)
+        os.close(saved_stdout)
+        os.close(saved_stderr)
+
+
+def _run_fix_command(command: str, cwd: str) -> tuple[int, str]:
+    """
+    Run a single fix command inside a repository.
+
+    pre-commit commands are run in-process through pre_commit.main when
+    pre-commit is importable, which avoids starting a new interpreter per fix.
+    The tradeoff is that pre-commit then runs in this script's Python
+    environment, and the working directory and output descriptors must be
+    switched for the call, so in-process runs are serialized. Other commands,
+    and pre-commit when it is not installed, go through the shell. Either
+    way stdout is discarded and stderr is returned.
+
+    Returns:
+        Tuple of (exit code, error output).
+    """
+    args = shlex.split(command)
+    if args[:1] == ["pre-commit"]:
+        try:
+            from pre_commit.main import main as precommit_main
+        except ImportError:
+            pass
+        else:
+            import tempfile
+
+            with _PRECOMMIT_LOCK, tempfile.TemporaryFile() as stderr_file:
+                with contextlib.chdir(cwd), _redirect_output(stderr_file):
+                    try:
+                        returncode = precommit_main(args[1:])
+                    except SystemExit as e:
+                        returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode("utf-8", errors="replace")
+            if returncode != 0 and not stderr:
+                stderr = f"pre-commit exited with {returncode}"
+            return returncode, stderr
+
+    import subprocess  # nosec B404 - needed for running fix commands
+
+    result = subprocess.run(
+        command,
+        shell=True,  # nosec B602 - fix commands are trusted (from our config)
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    return result.returncode, result.stderr
+
+
+def apply_fixes(repo_path: Path, report: RepoReport, jobs: int = 1) -> set[str]:
     """
     Apply automatic fixes for failed checks.
 
+    Each distinct fix command is run once, even when several checks suggest
+    it. With jobs > 1 the commands run concurrently, which is only safe when
+    they do not modify the same files; results are still printed in order.
+
     Args:
         repo_path: Path to the repository.
         report: The compliance report with check results.
+        jobs: Maximum number of fix commands to run at once.
 
     Returns:
-        List of fix commands that were executed.
+        Names of the checks whose fix command succeeded.
     """
-    executed_fixes = []
-
+    fixed: set[str] = set()
+    cwd = os.fspath(repo_path)
+    # Checks suggesting each command, in report order
+    checks_by_command: dict[str, list[str]] = {}
     for check in report.checks:
         if not check.passed and check.fix_command:
-            print(f"  Applying fix: {check.fix_command}")
+            checks_by_command.setdefault(check.fix_command, []).append(check.name)
+    commands = list(checks_by_command)
+    if not commands:
+        return fixed
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(commands)))) as executor:
+        futures = [executor.submit(_run_fix_command, command, cwd) for command in commands]
+        for command, future in zip(commands, futures, strict=True):
+            # Never print while an in-process pre-commit run has stdout redirected
+            with _PRECOMMIT_LOCK:
+                print(f"  Applying fix: {command}")
             try:
-                result = subprocess.run(
-                    check.fix_command,
-                    shell=True,  # nosec B602 - fix commands are trusted (from our config)
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                )
-                if result.returncode == 0:
-                    executed_fixes.append(check.fix_command)
-                    print("    ✓ Success")
+                returncode, stderr = future.result()
+                if returncode == 0:
+                    fixed.update(checks_by_command[command])
+                    status = "    ✓ Success"
                 else:
-                    print(f"    ✗ Failed: {result.stderr}")
+                    status = f"    ✗ Failed: {stderr}"
             except Exception as e:
-                print(f"    ✗ Error: {e}")
+                status = f"    ✗ Error: {e}"
+            with _PRECOMMIT_LOCK:
+                print(status)
 
-    return executed_fixes
+    return fixed
 
 
 def init_repository(repo_path: Path, project_name: str | None = None) -> None:
@@ -1248,10 +2017,13 @@ def init_repository(repo_path: Path, project_name: str | None = None) -> None:
     files_created = []
     files_skipped = []
 
+    # Existing files are looked up in one listing per directory
+    index = RepoIndex(repo_path)
+
     # Create .gitignore
     gitignore_path = repo_path / ".gitignore"
-    if not gitignore_path.exists():
-        gitignore_path.write_text(GITIGNORE_TEMPLATE)
+    if not index.exists(".gitignore"):
+        _atomic_write_bytes(gitignore_path, _GITIGNORE_BYTES)
         files_created.append(".gitignore")
         print("  ✓ Created .gitignore")
     else:
@@ -1260,11 +2032,9 @@ def init_repository(repo_path: Path, project_name: str | None = None) -> None:
 
     # Create LICENSE (download GPL-3.0)
     license_path = repo_path / "LICENSE"
-    if not license_path.exists():
+    if not index.exists("LICENSE"):
         try:
-            with urllib.request.urlopen(TEMPLATE_URLS["LICENSE"]) as response:  # nosec B310
-                license_content = response.read().decode("utf-8")
-            license_path.write_text(license_content)
+            _atomic_write_text(license_path, _fetch_template(TEMPLATE_URLS["LICENSE"]))
             files_created.append("LICENSE")
             print("  ✓ Created LICENSE (GPL-3.0)")
         except Exception as e:
@@ -1275,8 +2045,8 @@ def init_repository(repo_path: Path, project_name: str | None = None) -> None:
 
     # Create README.md
     readme_path = repo_path / "README.md"
-    if not readme_path.exists():
-        readme_path.write_text(get_readme_template(project_name))
+    if not index.exists("README.md"):
+        _atomic_write_text(readme_path, get_readme_template(project_name))
         files_created.append("README.md")
         print("  ✓ Created README.md")
     else:
@@ -1285,8 +2055,8 @@ def init_repository(repo_path: Path, project_name: str | None = None) -> None:
 
     # Create CLAUDE.md
     claude_md_path = repo_path / "CLAUDE.md"
-    if not claude_md_path.exists():
-        claude_md_path.write_text(get_claude_md_template(project_name))
+    if not index.exists("CLAUDE.md"):
+        _atomic_write_text(claude_md_path, get_claude_md_template(project_name))
         files_created.append("CLAUDE.md")
         print("  ✓ Created CLAUDE.md")
     else:
@@ -1295,8 +2065,8 @@ def init_repository(repo_path: Path, project_name: str | None = None) -> None:
 
     # Create .pre-commit-config.yaml
     precommit_path = repo_path / ".pre-commit-config.yaml"
-    if not precommit_path.exists():
-        precommit_path.write_text(PRECOMMIT_CONFIG_TEMPLATE)
+    if not index.exists(".pre-commit-config.yaml"):
+        _atomic_write_bytes(precommit_path, _PRECOMMIT_CONFIG_BYTES)
         files_created.append(".pre-commit-config.yaml")
         print("  ✓ Created .pre-commit-config.yaml")
     else:
@@ -1306,9 +2076,9 @@ def init_repository(repo_path: Path, project_name: str | None = None) -> None:
     # Create .github/workflows/ci.yml
     workflows_dir = repo_path / ".github" / "workflows"
     ci_path = workflows_dir / "ci.yml"
-    if not ci_path.exists():
+    if not index.exists(".github/workflows/ci.yml"):
         workflows_dir.mkdir(parents=True, exist_ok=True)
-        ci_path.write_text(CI_WORKFLOW_TEMPLATE)
+        _atomic_write_bytes(ci_path, _CI_WORKFLOW_BYTES)
         files_created.append(".github/workflows/ci.yml")
         print("  ✓ Created .github/workflows/ci.yml")
     else:
@@ -1335,6 +2105,8 @@ def init_repository(repo_path: Path, project_name: str | None = None) -> None:
 
 def main() -> int:
     """Main entry point."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Check repository compliance with pipe-works organization standards.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1363,6 +2135,15 @@ Examples:
         help="Treat path as directory containing multiple repositories",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        metavar="N",
+        help=f"Repositories to check in parallel with --scan-dir (default: {DEFAULT_JOBS})",
+    )
+
     parser.add_argument(
         "--format",
         choices=["text", "json"],
@@ -1376,6 +2157,33 @@ Examples:
         help="Apply automatic fixes for failed checks",
     )
 
+    parser.add_argument(
+        "--fix-jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Fix commands to run in parallel per repository with --fix (default: 1)",
+    )
+
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="List every passing pre-commit hook instead of one line per hook repo",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Check every repository again instead of reusing cached reports",
+    )
+
+    parser.add_argument(
+        "--cache-compliant",
+        action="store_true",
+        help="Skip repositories whose HEAD is unchanged since they were last found compliant",
+    )
+
     parser.add_argument(
         "--strict",
         action="store_true",
@@ -1397,7 +2205,9 @@ Examples:
 
     args = parser.parse_args()
 
+    # Resolved once here; the checks below are told not to resolve it again
     path = Path(args.path).resolve()
+    use_cache = not args.no_cache
 
     # Handle --init mode
     if args.init:
@@ -1411,7 +2221,7 @@ Examples:
         print("\n" + "=" * 60)
         print("POST-INITIALIZATION COMPLIANCE CHECK")
         print("=" * 60)
-        report = check_repository(path)
+        report = check_repository(path, args.verbose, use_cache, already_resolved=True)
         print(format_text_report(report))
 
         return 0 if report.is_compliant else 1
@@ -1422,47 +2232,67 @@ Examples:
 
     # Run checks
     if args.scan_dir:
-        reports = scan_directory(path)
+        reports = scan_directory(path, args.jobs, args.verbose, use_cache, args.cache_compliant)
         if not reports:
             print(f"No git repositories found in: {path}", file=sys.stderr)
             return 1
     else:
-        reports = [check_repository(path)]
+        reports = [
+            check_repository(
+                path,
+                args.verbose,
+                use_cache,
+                already_resolved=True,
+                cache_compliant=args.cache_compliant,
+            )
+        ]
 
     # Apply fixes if requested
     if args.fix:
         print("Applying fixes...")
+        fixed = []
         for report in reports:
             print(f"\n{report.repo_name}:")
-            apply_fixes(report.repo_path, report)
+            fixed.append(apply_fixes(report.repo_path, report, args.fix_jobs))
         print("\nRe-running checks...\n")
-        # Re-run checks after fixes
-        if args.scan_dir:
-            reports = scan_directory(path)
-        else:
-            reports = [check_repository(path)]
+        # Re-run what the fixes may have changed
+        with ThreadPoolExecutor(max_workers=max(1, min(args.jobs, len(reports)))) as executor:
+            reports = list(
+                executor.map(
+                    recheck,
+                    reports,
+                    fixed,
+                    [args.verbose] * len(reports),
+                    [use_cache] * len(reports),
+                )
+            )
 
     # Output results
     if args.format == "json":
         print(format_json_report(reports))
     else:
-        print("\n" + "=" * 60)
-        print("PIPE-WORKS ORGANIZATION COMPLIANCE REPORT")
-        print("=" * 60)
+        # Compose the whole report first and write it to stdout in one call
+        out = io.StringIO()
+        out.write("\n" + "=" * 60 + "\n")
+        out.write("PIPE-WORKS ORGANIZATION COMPLIANCE REPORT\n")
+        out.write("=" * 60 + "\n")
 
         for report in reports:
-            print(format_text_report(report))
+            out.write(format_text_report(report))
+            out.write("\n")
 
         # Overall summary for multiple repos
         if len(reports) > 1:
-            print("=" * 60)
-            print("OVERALL SUMMARY")
-            print("=" * 60)
             compliant = sum(1 for r in reports if r.is_compliant)
-            print(f"Total repositories: {len(reports)}")
-            print(f"Compliant: {compliant}")
-            print(f"Non-compliant: {len(reports) - compliant}")
-            print("")
+            out.write("=" * 60 + "\n")
+            out.write("OVERALL SUMMARY\n")
+            out.write("=" * 60 + "\n")
+            out.write(f"Total repositories: {len(reports)}\n")
+            out.write(f"Compliant: {compliant}\n")
+            out.write(f"Non-compliant: {len(reports) - compliant}\n")
+            out.write("\n")
+
+        sys.stdout.write(out.getvalue())
 
     # Exit code
     if args.strict: